@@ -0,0 +1,204 @@
+"""Tests for config/select_coding_agent against the shipped coding_agents.yaml."""
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+import itertools
+import sys
+from pathlib import Path
+
+import pytest
+
+yaml = pytest.importorskip("yaml")
+
+CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
+
+
+def _load_selector():
+    # The script has no .py suffix, so spell out the source loader.
+    loader = importlib.machinery.SourceFileLoader(
+        "select_coding_agent", str(CONFIG_DIR / "select_coding_agent")
+    )
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[loader.name] = module
+    loader.exec_module(module)
+    return module
+
+
+sca = _load_selector()
+
+
+def _yaml_configs():
+    data = yaml.safe_load((CONFIG_DIR / "coding_agents.yaml").read_text())["agents"]
+    return {
+        name: sca.AgentConfig(
+            name=name,
+            speed=entry["speed"],
+            cost=entry["cost"],
+            repo_awareness=entry["repo_awareness"],
+            obedience=entry["obedience"],
+            best_for=entry["best_for"],
+            max_concurrent_jobs=entry["max_concurrent_jobs"],
+        )
+        for name, entry in data.items()
+    }
+
+
+def _reference_select(issue, capacities, configs):
+    """The original scoring loop, kept verbatim as the equivalence oracle."""
+    w_speed = 0.4
+    w_cost = 0.2
+    w_repo = 0.2
+    w_best_for = 0.15
+    w_obedience = 0.05
+
+    best_choice = None
+
+    for name, cfg in configs.items():
+        cap = capacities.get(name, sca.AgentCapacity(in_flight=0, max_concurrent_jobs=cfg.max_concurrent_jobs))
+
+        if cap.in_flight >= cfg.max_concurrent_jobs:
+            continue
+
+        speed_component = cfg.speed * issue.urgency
+        cost_component = (1.0 - cfg.cost) * (1.0 - issue.urgency)
+        repo_component = cfg.repo_awareness if issue.needs_repo_awareness else 0.0
+        best_for_component = 1.0 if issue.task_kind in cfg.best_for else 0.0
+        obedience_component = cfg.obedience * issue.risk
+
+        score = (
+            w_speed * speed_component
+            + w_cost * cost_component
+            + w_repo * repo_component
+            + w_best_for * best_for_component
+            + w_obedience * obedience_component
+        )
+
+        if best_choice is None or score > best_choice.score:
+            reason_parts = []
+            if issue.needs_repo_awareness:
+                reason_parts.append(f"repo_awareness={cfg.repo_awareness:.2f}")
+            if issue.task_kind in cfg.best_for:
+                reason_parts.append(f"best_for={issue.task_kind}")
+            reason_parts.append(f"speed={cfg.speed:.2f}")
+            reason_parts.append(f"cost={cfg.cost:.2f}")
+            reason = "; ".join(reason_parts)
+
+            best_choice = sca.AgentChoice(agent_name=name, score=score, reason=reason)
+
+    return best_choice
+
+
+def _as_tuple(choice):
+    return None if choice is None else (choice.agent_name, choice.score, choice.reason)
+
+
+def _capacities_with_only(configs, eligible):
+    """Mark every agent outside ``eligible`` as full."""
+    return {
+        name: sca.AgentCapacity(in_flight=cfg.max_concurrent_jobs, max_concurrent_jobs=cfg.max_concurrent_jobs)
+        for name, cfg in configs.items()
+        if name not in eligible
+    }
+
+
+def test_matches_reference_on_yaml_grid():
+    configs = _yaml_configs()
+    # Task kinds only matter through best_for membership, and the YAML's
+    # best_for lists are disjoint: one kind per agent plus an unlisted one
+    # covers every distinct score.
+    task_kinds = [min(cfg.best_for) for cfg in configs.values()] + ["unlisted"]
+    urgencies = [i / 20 for i in range(21)]
+    risks = [i / 10 for i in range(11)]
+
+    # The strict ``>`` tie-break is decided pairwise, so single agents (exact
+    # scores), every pair (ordering and ties) and the full roster suffice.
+    eligible_sets = [
+        combo
+        for size in (1, 2, len(configs))
+        for combo in itertools.combinations(configs, size)
+    ]
+    capacity_sets = [(eligible, _capacities_with_only(configs, eligible)) for eligible in eligible_sets]
+
+    for task_kind, urgency, risk, needs_repo in itertools.product(
+        task_kinds, urgencies, risks, (False, True)
+    ):
+        issue = sca.IssueTraits(
+            id="ISSUE-1",
+            task_kind=task_kind,
+            urgency=urgency,
+            risk=risk,
+            needs_repo_awareness=needs_repo,
+        )
+        for eligible, capacities in capacity_sets:
+            expected = _reference_select(issue, capacities, configs)
+            actual = sca.select_coding_agent(issue, capacities, configs)
+            assert _as_tuple(actual) == _as_tuple(expected), (issue, eligible)
+
+
+def test_one_ulp_near_tie_matches_baseline_winner():
+    configs = _yaml_configs()
+    capacities = _capacities_with_only(configs, ("gemini", "jules", "chatgpt"))
+    issue = sca.IssueTraits(
+        id="ISSUE-1",
+        task_kind="non_urgent_experiment",
+        urgency=0.65,
+        risk=0.6,
+        needs_repo_awareness=True,
+    )
+
+    # Not a tie: jules scores 0.333 and chatgpt 0.3330000000000001, one ulp
+    # apart. Regrouping the weighted sum rounds both to 0.333 and hands the
+    # pick to jules, so this pins the baseline association.
+    choice = sca.select_coding_agent(issue, capacities, configs)
+
+    assert _as_tuple(choice) == _as_tuple(_reference_select(issue, capacities, configs))
+    assert choice.agent_name == "chatgpt"
+    assert choice.score == 0.3330000000000001
+
+
+def test_exact_score_tie_keeps_first_configured_agent():
+    configs = _yaml_configs()
+    issue = sca.IssueTraits(
+        id="ISSUE-1",
+        task_kind="unlisted",
+        urgency=0.15,
+        risk=0.2,
+        needs_repo_awareness=False,
+    )
+    copilot = sca.select_coding_agent(issue, _capacities_with_only(configs, ("copilot",)), configs)
+    chatgpt = sca.select_coding_agent(issue, _capacities_with_only(configs, ("chatgpt",)), configs)
+    assert copilot.score == chatgpt.score
+
+    choice = sca.select_coding_agent(issue, _capacities_with_only(configs, ("copilot", "chatgpt")), configs)
+
+    # copilot precedes chatgpt in coding_agents.yaml.
+    assert choice.agent_name == "copilot"
+
+
+def test_returns_none_when_every_agent_is_full():
+    configs = _yaml_configs()
+    capacities = {
+        name: sca.AgentCapacity(in_flight=cfg.max_concurrent_jobs, max_concurrent_jobs=cfg.max_concurrent_jobs)
+        for name, cfg in configs.items()
+    }
+    issue = sca.IssueTraits(id="ISSUE-1", task_kind="repo_code", urgency=0.5, risk=0.5, needs_repo_awareness=True)
+
+    assert sca.select_coding_agent(issue, capacities, configs) is None
+
+
+def test_agent_config_freezes_best_for():
+    cfg = sca.AgentConfig(
+        name="copilot",
+        speed=0.9,
+        cost=0.1,
+        repo_awareness=1.0,
+        obedience=0.8,
+        best_for={"repo_code"},
+        max_concurrent_jobs=4,
+    )
+
+    assert cfg.best_for == frozenset({"repo_code"})
+    assert isinstance(cfg.best_for, frozenset)
+    hash(cfg)